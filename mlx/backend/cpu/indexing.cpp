@@ -115,16 +115,38 @@ void gather(
     src_it = ContiguousIterator(slice_sizes, src.strides(), src.ndim());
   }
 
+  // Hoist the per-index pointers, strides, and axis sizes out of the
+  // gather loop
+  int nind = inds.size();
+  std::vector<const IdxT*> ind_ptrs(nind);
+  std::vector<int64_t> ind_strides(nind);
+  std::vector<int> ind_sizes(nind);
+  for (int ii = 0; ii < nind; ++ii) {
+    ind_ptrs[ii] = inds[ii].data<IdxT>();
+    ind_strides[ii] = src.strides()[axes[ii]];
+    ind_sizes[ii] = src.shape(axes[ii]);
+  }
+
+  // Fast path for a single contiguous index array selecting scalars. The
+  // plain pointer loop keeps the address computation vectorizable.
+  if (nind == 1 && slice_size == 1 && inds[0].flags().row_contiguous) {
+    const IdxT* idx_ptr = ind_ptrs[0];
+    auto stride = ind_strides[0];
+    auto axis_size = ind_sizes[0];
+    for (size_t i = 0; i < ind_size; ++i) {
+      dst_ptr[i] = src_ptr[offset_neg_idx(idx_ptr[i], axis_size) * stride];
+    }
+    return;
+  }
+
   size_t out_idx = 0;
   for (int idx = 0; idx < ind_size; idx++) {
     size_t src_idx = 0;
-    for (int ii = 0; ii < inds.size(); ++ii) {
-      auto ax = axes[ii];
+    for (int ii = 0; ii < nind; ++ii) {
       auto idx_loc = its[ii].loc;
       its[ii].step();
-      auto idx_val =
-          offset_neg_idx(inds[ii].data<IdxT>()[idx_loc], src.shape(ax));
-      src_idx += (idx_val * src.strides()[ax]);
+      auto idx_val = offset_neg_idx(ind_ptrs[ii][idx_loc], ind_sizes[ii]);
+      src_idx += (idx_val * ind_strides[ii]);
     }
 
     if (slice_size == 1) {
@@ -416,17 +438,26 @@ void scatter(
   ContiguousIterator update_it(updates);
   ContiguousIterator out_it(update_shape, out.strides(), out.ndim());
 
+  // Hoist the per-index pointers, strides, and axis sizes out of the
+  // update loop
+  std::vector<const IdxT*> ind_ptrs(nind);
+  std::vector<int64_t> ind_strides(nind);
+  std::vector<int> ind_sizes(nind);
+  for (int j = 0; j < nind; ++j) {
+    ind_ptrs[j] = inds[j].data<IdxT>();
+    ind_strides[j] = out.strides()[axes[j]];
+    ind_sizes[j] = out.shape(axes[j]);
+  }
+
   auto out_ptr = out.data<InT>();
   auto upd_ptr = updates.data<InT>();
   for (int i = 0; i < n_updates; ++i) {
     size_t out_offset = 0;
-    for (int j = 0; j < inds.size(); ++j) {
-      auto ax = axes[j];
+    for (int j = 0; j < nind; ++j) {
       auto idx_loc = its[j].loc;
       its[j].step();
-      auto idx_val =
-          offset_neg_idx(inds[j].data<IdxT>()[idx_loc], out.shape(ax));
-      out_offset += (idx_val * out.strides()[ax]);
+      auto idx_val = offset_neg_idx(ind_ptrs[j][idx_loc], ind_sizes[j]);
+      out_offset += (idx_val * ind_strides[j]);
     }
     update_it.seek(i * update_size);
     for (int j = 0; j < update_size; ++j) {
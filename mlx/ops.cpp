@@ -642,10 +642,10 @@ normalize_slice(const Shape& shape, Shape& start, Shape stop, Shape& strides) {
 
       // Clamp to bounds
       auto st = std::min(s, n - 1);
-      auto ed = e > -1 ? e : -1;
+      auto ed = std::max(e, static_cast<ShapeElem>(-1));
 
       start[i] = st;
-      ed = ed > st ? st : ed;
+      ed = std::min(ed, st);
 
       auto str = -strides[i];
       out_shape[i] = (start[i] - ed + str - 1) / str;
@@ -656,7 +656,7 @@ normalize_slice(const Shape& shape, Shape& start, Shape stop, Shape& strides) {
       auto ed = std::max(static_cast<ShapeElem>(0), std::min(e, n));
 
       start[i] = st;
-      ed = ed < st ? st : ed;
+      ed = std::max(ed, st);
 
       out_shape[i] = (ed - start[i] + strides[i] - 1) / strides[i];
     }
@@ -1014,6 +1014,24 @@ array concatenate(
 
   auto ax = normalize_axis_index(axis, arrays[0].ndim(), "[concatenate] ");
 
+  // Concatenating every output of a split, in order, along the split axis
+  // is the identity; return the split input instead of building two
+  // primitives
+  if (arrays[0].has_primitive() &&
+      arrays[0].siblings().size() + 1 == arrays.size()) {
+    if (auto split = dynamic_cast<const Split*>(&arrays[0].primitive());
+        split && split->state().second == ax) {
+      auto outputs = arrays[0].outputs();
+      bool is_identity = true;
+      for (int i = 0; i < arrays.size() && is_identity; ++i) {
+        is_identity = (arrays[i].id() == outputs[i].id());
+      }
+      if (is_identity) {
+        return arrays[0].inputs()[0];
+      }
+    }
+  }
+
   auto throw_invalid_shapes = [&]() {
     std::ostringstream msg;
     msg << "[concatenate] All the input array dimensions must match exactly "
@@ -1635,6 +1653,10 @@ array array_equal(
     StreamOrDevice s /* = {} */) {
   if (a.shape() != b.shape()) {
     return array(false);
+  } else if (
+      a.id() == b.id() && (equal_nan || !issubdtype(a.dtype(), inexact))) {
+    // The same array always equals itself unless NaNs compare unequal
+    return array(true);
   } else {
     auto dtype = promote_types(a.dtype(), b.dtype());
     equal_nan &= issubdtype(dtype, inexact);
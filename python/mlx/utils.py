@@ -1,4 +1,5 @@
 # Copyright © 2023 Apple Inc.
+import pickle
 from collections import defaultdict
 from itertools import zip_longest
 from typing import Any, Callable, List, Optional, Tuple
@@ -248,6 +249,48 @@ def tree_reduce(fn, tree, initializer=None, is_leaf=None):
     return accumulator
 
 
+def dump_arrays(arrays: List[Any], file: Any) -> None:
+    """Serialize a list of arrays to an open binary file.
+
+    The arrays are pickled with protocol 5 so their payloads are written
+    after the pickle stream as raw out-of-band buffers instead of being
+    copied into it, which keeps the per-array overhead to a small header.
+    Use :func:`load_arrays` to read them back.
+
+    Args:
+        arrays (list(array)): The arrays to serialize.
+        file (file-like): An open file in binary write mode.
+    """
+    buffers = []
+    head = pickle.dumps(list(arrays), protocol=5, buffer_callback=buffers.append)
+    pickle.dump((head, [b.raw().nbytes for b in buffers]), file, protocol=2)
+    for b in buffers:
+        file.write(b)
+
+
+def load_arrays(file: Any) -> List[Any]:
+    """Load a list of arrays written by :func:`dump_arrays`.
+
+    Args:
+        file (file-like): An open file in binary read mode.
+
+    Returns:
+        List[array]: The deserialized arrays.
+    """
+    head, sizes = pickle.load(file)
+    buffers = [file.read(n) for n in sizes]
+    return pickle.loads(head, buffers=buffers)
+
+
+def _reconstruct_array(data, dtype, shape):
+    # Reconstruction callable for array.__reduce_ex__. Pickle serializes it
+    # by reference as ``mlx.utils._reconstruct_array``, which the compiled
+    # binding it forwards to cannot be.
+    import mlx.core
+
+    return mlx.core._reconstruct_array(data, dtype, shape)
+
+
 def tree_merge(tree_a, tree_b, merge_fn=None):
     """Merge two Python trees in one containing the values of both. It can be
     thought of as a deep dict.update method.
@@ -12,6 +12,7 @@
 #include <nanobind/typing.h>
 
 #include "mlx/backend/metal/metal.h"
+#include "mlx/dtype_utils.h"
 #include "python/src/buffer.h"
 #include "python/src/convert.h"
 #include "python/src/indexing.h"
@@ -80,6 +81,104 @@ class ArrayPythonIterator {
   std::vector<mx::array> splits_;
 };
 
+// Fold in-place bitwise ops on available boolean scalars at binding time;
+// building and evaluating a graph node costs far more than the op itself.
+template <typename Op>
+bool fold_bool_iop(mx::array& a, const ScalarOrArray& v, Op op) {
+  if (a.dtype() != mx::bool_ || a.ndim() != 0 || !a.is_available()) {
+    return false;
+  }
+  auto pv = std::get_if<nb::bool_>(&v);
+  if (!pv) {
+    return false;
+  }
+  a.overwrite_descriptor(
+      mx::array(op(a.item<bool>(), nb::cast<bool>(*pv)), mx::bool_));
+  return true;
+}
+
+// Rebuild an array pickled as (buffer, dtype name, shape). The buffer is the
+// raw contiguous data, either in-band bytes or an out-of-band PickleBuffer.
+mx::array array_from_pickle(
+    const nb::object& data,
+    const std::string& dtype_str,
+    const mx::Shape& shape) {
+  std::optional<mx::Dtype> dtype;
+  for (auto t :
+       {mx::bool_,
+        mx::uint8,
+        mx::uint16,
+        mx::uint32,
+        mx::uint64,
+        mx::int8,
+        mx::int16,
+        mx::int32,
+        mx::int64,
+        mx::float16,
+        mx::bfloat16,
+        mx::float32,
+        mx::float64,
+        mx::complex64}) {
+    if (dtype_str == mx::dtype_to_string(t)) {
+      dtype = t;
+      break;
+    }
+  }
+  if (!dtype) {
+    throw std::invalid_argument(
+        "[array_from_pickle] Invalid dtype " + dtype_str + ".");
+  }
+
+  Py_buffer view;
+  if (PyObject_GetBuffer(data.ptr(), &view, PyBUF_SIMPLE) != 0) {
+    throw nb::python_error();
+  }
+  auto size = std::accumulate(
+      shape.begin(), shape.end(), int64_t{1}, std::multiplies<int64_t>());
+  if (view.len != size * dtype->size()) {
+    PyBuffer_Release(&view);
+    throw std::invalid_argument(
+        "[array_from_pickle] Buffer size does not match the shape.");
+  }
+  auto out = [&]() -> mx::array {
+    const void* buf = view.buf;
+    switch (*dtype) {
+      case mx::bool_:
+        return mx::array(static_cast<const bool*>(buf), shape, *dtype);
+      case mx::uint8:
+        return mx::array(static_cast<const uint8_t*>(buf), shape, *dtype);
+      case mx::uint16:
+        return mx::array(static_cast<const uint16_t*>(buf), shape, *dtype);
+      case mx::uint32:
+        return mx::array(static_cast<const uint32_t*>(buf), shape, *dtype);
+      case mx::uint64:
+        return mx::array(static_cast<const uint64_t*>(buf), shape, *dtype);
+      case mx::int8:
+        return mx::array(static_cast<const int8_t*>(buf), shape, *dtype);
+      case mx::int16:
+        return mx::array(static_cast<const int16_t*>(buf), shape, *dtype);
+      case mx::int32:
+        return mx::array(static_cast<const int32_t*>(buf), shape, *dtype);
+      case mx::int64:
+        return mx::array(static_cast<const int64_t*>(buf), shape, *dtype);
+      case mx::float16:
+        return mx::array(static_cast<const mx::float16_t*>(buf), shape, *dtype);
+      case mx::bfloat16:
+        return mx::array(
+            static_cast<const mx::bfloat16_t*>(buf), shape, *dtype);
+      case mx::float32:
+        return mx::array(static_cast<const float*>(buf), shape, *dtype);
+      case mx::float64:
+        return mx::array(static_cast<const double*>(buf), shape, *dtype);
+      default:
+        return mx::array(
+            static_cast<const mx::complex64_t*>(buf), shape, *dtype);
+    }
+  }();
+  PyBuffer_Release(&view);
+  return out;
+}
+
 void init_array(nb::module_& m) {
   // Set Python print formatting options
   mx::get_global_formatter().capitalize_bool = true;
@@ -377,7 +476,11 @@ void init_array(nb::module_& m) {
               throw std::invalid_argument(
                   "Explicitly specifying api_version is not yet implemented.");
             }
-            return nb::module_::import_("mlx.core");
+            // Import once; array-API consumers call this per input array.
+            // Intentionally leaked so no destructor runs at interpreter
+            // shutdown
+            static auto mlx = nb::module_::import_("mlx.core").release();
+            return nb::borrow<nb::object>(mlx);
           },
           "api_version"_a = nb::none(),
           R"pbdoc(
@@ -454,6 +557,48 @@ void init_array(nb::module_& m) {
              const nb::ndarray<nb::ro, nb::c_contig, nb::device::cpu>& state) {
             new (&arr) mx::array(nd_array_to_mlx(state, std::nullopt));
           })
+      .def(
+          "__reduce_ex__",
+          [](const nb::object& self, int protocol) {
+            auto a = nb::cast<mx::array>(self);
+            auto mlx = nb::module_::import_("mlx.core");
+            if (protocol >= 5) {
+              // Hand the raw contiguous buffer to pickle as a PickleBuffer
+              // so protocol 5 consumers can move it out-of-band without a
+              // copy
+              auto pickle = nb::module_::import_("pickle");
+              auto buf =
+                  pickle.attr("PickleBuffer")(nb::cast(mx::contiguous(a)));
+              // Reconstruct through the pure Python forwarder since pickle
+              // cannot serialize the binding itself by reference
+              return nb::make_tuple(
+                  nb::module_::import_("mlx.utils").attr("_reconstruct_array"),
+                  nb::make_tuple(
+                      buf,
+                      std::string(mx::dtype_to_string(a.dtype())),
+                      nb::cast(a.shape())));
+            }
+            if (a.dtype() == mx::bfloat16) {
+              // No numpy dtype to round-trip through; serialize the raw
+              // bits in-band instead
+              auto contig = nb::cast(mx::contiguous(a));
+              auto buf =
+                  nb::steal(nb::handle(PyBytes_FromObject(contig.ptr())));
+              if (!buf.is_valid()) {
+                throw nb::python_error();
+              }
+              return nb::make_tuple(
+                  nb::module_::import_("mlx.utils").attr("_reconstruct_array"),
+                  nb::make_tuple(
+                      buf,
+                      std::string(mx::dtype_to_string(a.dtype())),
+                      nb::cast(a.shape())));
+            }
+            // Older protocols cannot serialize a PickleBuffer; fall back to
+            // rebuilding from a numpy array
+            return nb::make_tuple(
+                mlx.attr("array"), nb::make_tuple(mlx_to_np_array(a)));
+          })
       .def("__dlpack__", [](const mx::array& a) { return mlx_to_dlpack(a); })
       .def(
           "__dlpack_device__",
@@ -814,6 +959,9 @@ void init_array(nb::module_& m) {
             if (!is_comparable_with_array(v)) {
               throw_invalid_operation("inplace bitwise and", v);
             }
+            if (fold_bool_iop(a, v, [](bool x, bool y) { return x && y; })) {
+              return a;
+            }
             auto b = to_array(v, a.dtype());
             if (mx::issubdtype(a.dtype(), mx::inexact) ||
                 mx::issubdtype(b.dtype(), mx::inexact)) {
@@ -846,6 +994,9 @@ void init_array(nb::module_& m) {
             if (!is_comparable_with_array(v)) {
               throw_invalid_operation("inplace bitwise or", v);
             }
+            if (fold_bool_iop(a, v, [](bool x, bool y) { return x || y; })) {
+              return a;
+            }
             auto b = to_array(v, a.dtype());
             if (mx::issubdtype(a.dtype(), mx::inexact) ||
                 mx::issubdtype(b.dtype(), mx::inexact)) {
@@ -942,6 +1093,9 @@ void init_array(nb::module_& m) {
             if (!is_comparable_with_array(v)) {
               throw_invalid_operation("inplace bitwise xor", v);
             }
+            if (fold_bool_iop(a, v, [](bool x, bool y) { return x != y; })) {
+              return a;
+            }
             auto b = to_array(v, a.dtype());
             if (mx::issubdtype(a.dtype(), mx::inexact) ||
                 mx::issubdtype(b.dtype(), mx::inexact)) {
@@ -964,7 +1118,7 @@ void init_array(nb::module_& m) {
             } else if (a.ndim() == 0) {
               auto obj = to_scalar(a);
               return nb::cast<std::string>(
-                  nb::handle(PyObject_Format(obj.ptr(), format_spec.ptr())));
+                  nb::steal(PyObject_Format(obj.ptr(), format_spec.ptr())));
             } else {
               nb::gil_scoped_release nogil;
               std::ostringstream os;
@@ -1492,4 +1646,7 @@ void init_array(nb::module_& m) {
           nb::kw_only(),
           "stream"_a = nb::none(),
           "See :func:`view`.");
+
+  m.def(
+      "_reconstruct_array", &array_from_pickle, "data"_a, "dtype"_a, "shape"_a);
 }
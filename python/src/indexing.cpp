@@ -43,9 +43,13 @@ void get_slice_params(
       nb::getattr(in_slice, "stop"), strides < 0 ? -axis_size - 1 : axis_size);
 }
 
+// Wrap a possibly negative index without a data-dependent branch
+inline int normalize_index(int idx, int axis_size) {
+  return idx + (axis_size & -(idx < 0));
+}
+
 mx::array get_int_index(nb::object idx, int axis_size) {
-  int idx_ = nb::cast<int>(idx);
-  idx_ = (idx_ < 0) ? idx_ + axis_size : idx_;
+  int idx_ = normalize_index(nb::cast<int>(idx), axis_size);
 
   return mx::array(idx_, mx::uint32);
 }
@@ -112,6 +116,7 @@ mx::array mlx_gather_nd(
     int& max_dims) {
   max_dims = 0;
   std::vector<mx::array> gather_indices;
+  gather_indices.reserve(indices.size());
   std::vector<bool> is_slice(indices.size(), false);
   int num_slices = 0;
   // gather all the arrays
@@ -124,8 +129,8 @@ mx::array mlx_gather_nd(
           start, end, stride, nb::cast<nb::slice>(idx), src.shape(i));
 
       // Handle negative indices
-      start = (start < 0) ? start + src.shape(i) : start;
-      end = (end < 0) ? end + src.shape(i) : end;
+      start = normalize_index(start, src.shape(i));
+      end = normalize_index(end, src.shape(i));
 
       gather_indices.push_back(arange(start, end, stride, mx::uint32));
       num_slices++;
@@ -275,39 +280,29 @@ mx::array mlx_get_item_nd(mx::array src, const nb::tuple& entries) {
   std::vector<nb::object> remaining_indices;
   bool have_array = false;
   {
-    // First check whether the results of gather are going to be 1st or
-    // normally in between.
+    // Classify the indices in a single pass: count the arrays, find the
+    // last array or integer, and check whether the gather results go 1st
+    // or normally in between.
     bool have_non_array = false;
     bool gather_first = false;
-    for (auto& idx : indices) {
-      if (nb::isinstance<mx::array>(idx) || (nb::isinstance<nb::int_>(idx))) {
-        if (have_array && have_non_array) {
-          gather_first = true;
-          break;
-        }
+    int n_arr = 0;
+    int last_array = -1;
+    for (int i = 0; i < indices.size(); ++i) {
+      auto& idx = indices[i];
+      bool is_array = nb::isinstance<mx::array>(idx);
+      if (is_array || nb::isinstance<nb::int_>(idx)) {
+        n_arr += is_array;
+        gather_first |= have_array && have_non_array;
         have_array = true;
+        last_array = i;
       } else {
         have_non_array |= have_array;
       }
     }
 
-    int n_arr = 0;
-    for (auto& idx : indices) {
-      n_arr += nb::isinstance<mx::array>(idx);
-    }
-
     have_array &= n_arr > 0;
 
     if (have_array) {
-      int last_array;
-      // Then find the last array
-      for (last_array = indices.size() - 1; last_array >= 0; last_array--) {
-        auto& idx = indices[last_array];
-        if (nb::isinstance<mx::array>(idx) || nb::isinstance<nb::int_>(idx)) {
-          break;
-        }
-      }
-
       std::vector<nb::object> gather_indices;
       for (int i = 0; i <= last_array; i++) {
         auto& idx = indices[i];
@@ -377,8 +372,7 @@ mx::array mlx_get_item_nd(mx::array src, const nb::tuple& entries) {
     for (auto& idx : remaining_indices) {
       if (!idx.is_none()) {
         if (!have_array && nb::isinstance<nb::int_>(idx)) {
-          int st = nb::cast<int>(idx);
-          st = (st < 0) ? st + src.shape(axis) : st;
+          int st = normalize_index(nb::cast<int>(idx), src.shape(axis));
 
           starts[axis] = st;
           ends[axis] = st + 1;
@@ -803,8 +797,7 @@ auto mlx_slice_update(
       msg << "Too many indices for array with " << src.ndim() << " dimensions.";
       throw std::invalid_argument(msg.str());
     }
-    auto idx = nb::cast<int>(obj);
-    idx = idx < 0 ? idx + stops[0] : idx;
+    auto idx = normalize_index(nb::cast<int>(obj), stops[0]);
     starts[0] = idx;
     stops[0] = idx + 1;
     auto out = slice_update(
@@ -864,8 +857,7 @@ auto mlx_slice_update(
       ax--;
       upd_ax--;
     } else if (nb::isinstance<nb::int_>(pyidx)) {
-      int st = nb::cast<int>(pyidx);
-      st = (st < 0) ? st + src.shape(i) : st;
+      int st = normalize_index(nb::cast<int>(pyidx), src.shape(i));
       starts[ax] = st;
       stops[ax] = st + 1;
       if (upd_ax >= 0) {
@@ -885,10 +877,46 @@ auto mlx_slice_update(
   return std::make_pair(true, out);
 }
 
+// Rewrite an integer list forming an arithmetic progression, e.g.
+// [0, 2, 4], into the equivalent slice so setitem can take the strided
+// slice update path instead of a scatter
+std::optional<nb::slice> list_to_slice(const nb::list& l, int axis_size) {
+  std::vector<int64_t> vals;
+  vals.reserve(l.size());
+  for (auto v : l) {
+    if (!nb::isinstance<nb::int_>(v) || nb::isinstance<nb::bool_>(v)) {
+      return std::nullopt;
+    }
+    vals.push_back(nb::cast<int64_t>(v));
+  }
+  if (vals.empty() || vals.front() < 0 || vals.back() >= axis_size) {
+    return std::nullopt;
+  }
+  int64_t step = vals.size() > 1 ? vals[1] - vals[0] : 1;
+  if (step <= 0) {
+    return std::nullopt;
+  }
+  for (size_t i = 2; i < vals.size(); ++i) {
+    if (vals[i] - vals[i - 1] != step) {
+      return std::nullopt;
+    }
+  }
+  return nb::slice(vals.front(), vals.back() + 1, step);
+}
+
 void mlx_set_item(
     mx::array& src,
     const nb::object& obj,
     const ScalarOrArray& v) {
+  if (src.ndim() > 0 && nb::isinstance<nb::list>(obj)) {
+    if (auto s = list_to_slice(nb::cast<nb::list>(obj), src.shape(0))) {
+      auto [success, out] = mlx_slice_update(src, *s, v);
+      if (success) {
+        src.overwrite_descriptor(out);
+        return;
+      }
+    }
+  }
   auto [success, out] = mlx_slice_update(src, obj, v);
   if (success) {
     src.overwrite_descriptor(out);
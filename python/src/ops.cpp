@@ -5289,4 +5289,32 @@ void init_ops(nb::module_& m) {
             >>> mx.broadcast_shapes((5, 1, 4), (1, 3, 1))
             (5, 3, 4)
       )pbdoc");
+  m.def(
+      "_repeat_op",
+      [](const std::string& op, mx::array x, int n) {
+        // Build a deep op chain in a native loop. Only used by the tests to
+        // stress graph construction and teardown without the Python
+        // interpreter dominating.
+        if (op == "sin") {
+          for (int i = 0; i < n; ++i) {
+            x = mx::sin(x);
+          }
+        } else if (op == "add_self") {
+          for (int i = 0; i < n; ++i) {
+            x = mx::add(x, x);
+          }
+        } else if (op == "concat_split") {
+          for (int i = 0; i < n; ++i) {
+            // Swap the halves so this does not fold to the identity
+            auto parts = mx::split(x, 2);
+            x = mx::concatenate({parts[1], parts[0]});
+          }
+        } else {
+          throw std::invalid_argument("[_repeat_op] Unknown op " + op + ".");
+        }
+        return x;
+      },
+      "op"_a,
+      "x"_a,
+      "n"_a);
 }
@@ -11,7 +11,17 @@ mx::array to_array(
   if (auto pv = std::get_if<nb::bool_>(&v); pv) {
     return mx::array(nb::cast<bool>(*pv), dtype.value_or(mx::bool_));
   } else if (auto pv = std::get_if<nb::int_>(&v); pv) {
-    auto val = nb::cast<long>(*pv);
+    // One C API call with an overflow flag instead of the generic cast
+    // machinery
+    int overflow = 0;
+    auto val = static_cast<int64_t>(
+        PyLong_AsLongLongAndOverflow(pv->ptr(), &overflow));
+    if (overflow) {
+      std::ostringstream msg;
+      msg << "Converting Python int to " << dtype.value_or(mx::int64)
+          << " would result in overflow.";
+      throw std::invalid_argument(msg.str());
+    }
     auto default_type = (val > std::numeric_limits<int>::max() ||
                          val < std::numeric_limits<int>::min())
         ? mx::int64
@@ -1759,6 +1759,14 @@ class TestOps(mlx_tests.MLXTestCase):
         out = mx.concatenate([a, b], axis=1)
         self.assertTrue(mx.array_equal(out, b))
 
+        # Concatenating a split in order folds to the input
+        a = mx.array(a_npy)
+        for axis in (0, 1):
+            out = mx.concatenate(mx.split(a, 4, axis=axis), axis=axis)
+            self.assertTrue(mx.array_equal(out, a))
+            out = mx.concatenate(mx.split(a, 4, axis=axis)[::-1], axis=axis)
+            self.assertFalse(mx.array_equal(out, a))
+
     def test_meshgrid(self):
         x = mx.array([1, 2, 3], dtype=mx.int32)
         y = np.array([1, 2, 3], dtype=np.int32)